@@ -35,7 +35,7 @@ class OpportunityServiceAdapter:
     ) -> Opportunity:
         """Create a new opportunity."""
         # Basic validation
-        if not title or len(title.strip()) == 0:
+        if not title or not title.strip():
             raise ValidationException("Title is required")
         
         if annual_recurring_revenue < 0:
@@ -60,8 +60,8 @@ class OpportunityServiceAdapter:
         )
         
         self.db.add(opportunity)
-        self.db.commit()
-        self.db.refresh(opportunity)
+        # Flush to assign the opportunity ID; everything commits in one transaction below
+        self.db.flush()
         
         # Create initial status record
         status_record = OpportunityStatus(
@@ -224,8 +224,7 @@ class OpportunityServiceAdapter:
             raise ValidationException("At least one skill requirement is required before submission")
         
         # Validate at least one "MUST_HAVE" skill
-        must_have_skills = [sr for sr in skill_requirements if sr.importance_level == "MUST_HAVE"]
-        if not must_have_skills:
+        if not any(sr.importance_level == "MUST_HAVE" for sr in skill_requirements):
             raise ValidationException("At least one 'Must Have' skill requirement is required")
         
         # Validate timeline requirement exists
@@ -239,9 +238,6 @@ class OpportunityServiceAdapter:
         opportunity.status = "SUBMITTED"
         opportunity.submitted_at = datetime.utcnow()
         
-        self.db.commit()
-        self.db.refresh(opportunity)
-        
         # Create status record
         status_record = OpportunityStatus(
             opportunity_id=opportunity.id,
@@ -278,20 +274,18 @@ class OpportunityServiceAdapter:
             raise OperationNotAllowedException("Completed opportunities cannot be cancelled")
         
         # Validate reason is provided
-        if not reason or len(reason.strip()) == 0:
+        if not reason or not reason.strip():
             raise ValidationException("Cancellation reason is required")
         
         # Store previous status for change record
         previous_status = opportunity.status
         
         # Update opportunity
+        now = datetime.utcnow()
         opportunity.status = "CANCELLED"
-        opportunity.cancelled_at = datetime.utcnow()
+        opportunity.cancelled_at = now
         opportunity.cancellation_reason = reason
-        opportunity.reactivation_deadline = datetime.utcnow()  # Simplified - should be +90 days
-        
-        self.db.commit()
-        self.db.refresh(opportunity)
+        opportunity.reactivation_deadline = now  # Simplified - should be +90 days
         
         # Create status record
         status_record = OpportunityStatus(
@@ -346,9 +340,6 @@ class OpportunityServiceAdapter:
         opportunity.cancellation_reason = None
         opportunity.reactivation_deadline = None
         
-        self.db.commit()
-        self.db.refresh(opportunity)
-        
         # Create status record
         status_record = OpportunityStatus(
             opportunity_id=opportunity.id,
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from .base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Attachment(BaseEntity):
     """Attachment entity representing a file attached to provide additional context."""
     
@@ -7,13 +7,20 @@ from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, field
 
-@dataclass
+@dataclass(slots=True)
 class BaseEntity:
     """Base class for all entities in the domain model."""
     
-    id: uuid.UUID = field(default_factory=uuid.uuid4)
-    created_at: datetime = field(default_factory=datetime.now)
-    updated_at: datetime = field(default_factory=datetime.now)
+    id: uuid.UUID = field(default_factory=uuid.uuid4, kw_only=True)
+    created_at: Optional[datetime] = field(default=None, kw_only=True)
+    updated_at: Optional[datetime] = field(default=None, kw_only=True)
+    
+    def __post_init__(self):
+        """Stamp both timestamps from a single clock read."""
+        if self.created_at is None:
+            self.created_at = datetime.now()
+        if self.updated_at is None:
+            self.updated_at = self.created_at
     
     def update(self) -> None:
         """Update the entity's last modified timestamp."""
@@ -9,7 +9,7 @@ from datetime import datetime
 
 from .base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ChangeRecord(BaseEntity):
     """ChangeRecord entity representing a change made to an opportunity for audit purposes."""
     
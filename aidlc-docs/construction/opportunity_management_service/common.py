@@ -3,16 +3,65 @@ Common utilities and base classes for the Opportunity Management Service.
 """
 
 import uuid
+import atexit
 import datetime
 import logging
+import logging.handlers
+import queue
+import threading
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Any, TypeVar, Generic
 
+# Maximum number of log records waiting for the background writer
+_LOG_QUEUE_MAXSIZE = 10_000
+
+def _put_dropping_oldest(log_queue: queue.Queue, item) -> None:
+    """Put an item on a bounded queue, dropping the oldest entry instead of blocking when it is full."""
+    try:
+        log_queue.put_nowait(item)
+    except queue.Full:
+        try:
+            log_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            log_queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops the oldest record instead of blocking when the queue is full."""
+    
+    def enqueue(self, record):
+        _put_dropping_oldest(self.queue, record)
+
+class _DroppingQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop sentinel displaces the oldest record when the queue is full."""
+    
+    def enqueue_sentinel(self):
+        _put_dropping_oldest(self.queue, self._sentinel)
+
+def _configure_logging():
+    """Log through a bounded queue so slow sinks never block the caller."""
+    root = logging.getLogger()
+    if root.handlers:
+        # Respect logging that has already been configured, as basicConfig does
+        return
+    
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+    log_queue = queue.Queue(maxsize=_LOG_QUEUE_MAXSIZE)
+    listener = _DroppingQueueListener(log_queue, stream_handler, respect_handler_level=True)
+    
+    root.setLevel(logging.INFO)
+    root.addHandler(_DroppingQueueHandler(log_queue))
+    listener.start()
+    atexit.register(listener.stop)
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
 # Type variable for generic repository
@@ -23,6 +72,10 @@ class EventPublisher:
     """Simple event publisher for domain events."""
     
     _subscribers = {}
+    _queue: Optional[queue.Queue] = None
+    _worker: Optional[threading.Thread] = None
+    # Guards the queue swap so no publisher enqueues after the stop sentinel
+    _lock = threading.Lock()
     
     @classmethod
     def subscribe(cls, event_type: str, callback):
@@ -30,18 +83,86 @@ class EventPublisher:
         if event_type not in cls._subscribers:
             cls._subscribers[event_type] = []
         cls._subscribers[event_type].append(callback)
-        logger.info(f"Subscribed to event: {event_type}")
+        logger.info("Subscribed to event: %s", event_type)
     
     @classmethod
     def publish(cls, event_type: str, data: Any):
-        """Publish an event."""
-        logger.info(f"Publishing event: {event_type}")
+        """Publish an event, enqueueing it when background dispatch is enabled."""
+        with cls._lock:
+            event_queue = cls._queue
+            if event_queue is not None:
+                cls._enqueue(event_queue, (event_type, data))
+                return
+        cls._dispatch(event_type, data)
+    
+    @staticmethod
+    def _enqueue(event_queue: queue.Queue, item: tuple):
+        """Enqueue an event, dropping the oldest pending event rather than block the caller."""
+        try:
+            event_queue.put_nowait(item)
+        except queue.Full:
+            try:
+                dropped_type, _ = event_queue.get_nowait()
+                logger.warning("Event queue full, dropped event: %s", dropped_type)
+            except queue.Empty:
+                pass
+            try:
+                event_queue.put_nowait(item)
+            except queue.Full:
+                logger.warning("Event queue full, dropped event: %s", item[0])
+    
+    @classmethod
+    def _dispatch(cls, event_type: str, data: Any):
+        """Deliver an event to its subscribers."""
+        logger.info("Publishing event: %s", event_type)
         if event_type in cls._subscribers:
             for callback in cls._subscribers[event_type]:
                 try:
                     callback(data)
                 except Exception as e:
-                    logger.error(f"Error in event subscriber: {e}")
+                    logger.error("Error in event subscriber: %s", e)
+    
+    @classmethod
+    def start_background_dispatch(cls, maxsize: int = 10_000):
+        """Deliver events on a daemon worker thread instead of the publishing thread."""
+        with cls._lock:
+            if cls._worker is not None:
+                return
+            cls._queue = queue.Queue(maxsize=maxsize)
+            cls._worker = threading.Thread(target=cls._drain, args=(cls._queue,),
+                                           name="event-publisher", daemon=True)
+            cls._worker.start()
+    
+    @classmethod
+    def stop_background_dispatch(cls):
+        """Deliver pending events, stop the worker and return to synchronous dispatch."""
+        with cls._lock:
+            if cls._worker is None:
+                return
+            event_queue, worker = cls._queue, cls._worker
+            cls._queue = None
+            cls._worker = None
+        # Publishers can no longer reach this queue, so the sentinel cannot be dropped
+        event_queue.put(None)
+        worker.join()
+    
+    @classmethod
+    def _drain(cls, event_queue: queue.Queue):
+        """Worker loop: dispatch queued events until the stop sentinel arrives."""
+        while True:
+            item = event_queue.get()
+            if item is None:
+                break
+            cls._dispatch(*item)
+
+def parse_iso_date(value: str) -> datetime.date:
+    """Parse a date string, taking the fast path for plain ISO dates."""
+    try:
+        return datetime.date.fromisoformat(value)
+    except (ValueError, TypeError):
+        # Fall back to the lenient parser for other formats
+        from dateutil.parser import parse
+        return parse(value).date()
 
 # Base repository interface
 class Repository(Generic[T], ABC):
@@ -8,7 +8,7 @@ from typing import Optional, List
 
 from .base_entity import BaseEntity
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Customer(BaseEntity):
     """Customer entity representing a client organization."""
     
@@ -25,13 +25,18 @@ class Customer(BaseEntity):
     def update_contact_info(self, name: Optional[str] = None, email: Optional[str] = None,
                            phone: Optional[str] = None) -> None:
         """Update primary contact information."""
+        changed = False
         if name:
             self.primary_contact_name = name
+            changed = True
         if email:
             self.primary_contact_email = email
+            changed = True
         if phone:
             self.primary_contact_phone = phone
-        self.update()
+            changed = True
+        if changed:
+            self.update()
     
     def deactivate(self) -> None:
         """Deactivate the customer."""
@@ -2,7 +2,28 @@
 Enumerations for the Opportunity Management Service.
 """
 
+import sys
 from enum import Enum, auto
+from typing import Dict, Union
+
+from .common import ValidationException
+
+def _build_lookup(enum_cls) -> Dict[str, Enum]:
+    """Map each member's case-folded name and value to the member."""
+    lookup = {}
+    for member in enum_cls:
+        lookup[sys.intern(member.name.casefold())] = member
+        lookup[sys.intern(member.value.casefold())] = member
+    return lookup
+
+def _lookup(table: Dict[str, Enum], enum_cls, value: Union[str, Enum]) -> Enum:
+    """Resolve a member from a prebuilt lookup table in a single dict access."""
+    if isinstance(value, enum_cls):
+        return value
+    try:
+        return table[value.casefold()]
+    except (KeyError, AttributeError):
+        raise ValidationException(f"Invalid {enum_cls.__name__}: {value}") from None
 
 class Priority(Enum):
     """Priority levels for opportunities."""
@@ -10,6 +31,13 @@ class Priority(Enum):
     MEDIUM = "Medium"
     HIGH = "High"
     CRITICAL = "Critical"
+    
+    @classmethod
+    def from_string(cls, value: Union[str, 'Priority']) -> 'Priority':
+        """Get a priority from its name or value, case-insensitively."""
+        return _lookup(_PRIORITY_LOOKUP, cls, value)
+
+_PRIORITY_LOOKUP = _build_lookup(Priority)
 
 class OpportunityStatus(Enum):
     """Status values for opportunities."""
@@ -20,6 +48,13 @@ class OpportunityStatus(Enum):
     ARCHITECT_SELECTED = "Architect Selected"
     COMPLETED = "Completed"
     CANCELLED = "Cancelled"
+    
+    @classmethod
+    def from_string(cls, value: Union[str, 'OpportunityStatus']) -> 'OpportunityStatus':
+        """Get an opportunity status from its name or value, case-insensitively."""
+        return _lookup(_OPPORTUNITY_STATUS_LOOKUP, cls, value)
+
+_OPPORTUNITY_STATUS_LOOKUP = _build_lookup(OpportunityStatus)
 
 class SkillType(Enum):
     """Types of skills."""
@@ -32,6 +67,13 @@ class ImportanceLevel(Enum):
     """Importance levels for skill requirements."""
     MUST_HAVE = "Must Have"
     NICE_TO_HAVE = "Nice to Have"
+    
+    @classmethod
+    def from_string(cls, value: Union[str, 'ImportanceLevel']) -> 'ImportanceLevel':
+        """Get an importance level from its name or value, case-insensitively."""
+        return _lookup(_IMPORTANCE_LEVEL_LOOKUP, cls, value)
+
+_IMPORTANCE_LEVEL_LOOKUP = _build_lookup(ImportanceLevel)
 
 class ProficiencyLevel(Enum):
     """Proficiency levels for skills."""
@@ -52,6 +94,13 @@ class UserRole(Enum):
     SOLUTION_ARCHITECT = "SolutionArchitect"
     SALES_MANAGER = "SalesManager"
     ADMIN = "Admin"
+    
+    @classmethod
+    def from_string(cls, value: Union[str, 'UserRole']) -> 'UserRole':
+        """Get a user role from its name or value, case-insensitively."""
+        return _lookup(_USER_ROLE_LOOKUP, cls, value)
+
+_USER_ROLE_LOOKUP = _build_lookup(UserRole)
 
 class SkillCategory(Enum):
     """Categories for skills in the Skills Catalog."""
@@ -3,12 +3,13 @@ In-memory repository implementations for the Opportunity Management Service.
 """
 
 import uuid
+from operator import attrgetter
 from typing import Dict, List, Optional, TypeVar, Generic, Any
 from datetime import datetime
 import logging
 import re
 
-from .common import NotFoundException
+from .common import NotFoundException, parse_iso_date
 from .repositories import (
     UserRepository, CustomerRepository, SkillsCatalogRepository,
     OpportunityRepository, ProblemStatementRepository, SkillRequirementRepository,
@@ -40,14 +41,14 @@ class InMemoryRepository(Generic[T]):
     def add(self, entity: T) -> T:
         """Add an entity to the repository."""
         self._entities[entity.id] = entity
-        logger.info(f"Added entity with ID {entity.id} to repository")
+        logger.info("Added entity with ID %s to repository", entity.id)
         return entity
     
     def get_by_id(self, entity_id: uuid.UUID) -> Optional[T]:
         """Get an entity by its ID."""
         entity = self._entities.get(entity_id)
         if not entity:
-            logger.warning(f"Entity with ID {entity_id} not found")
+            logger.warning("Entity with ID %s not found", entity_id)
             return None
         return entity
     
@@ -57,23 +58,71 @@ class InMemoryRepository(Generic[T]):
             raise NotFoundException(f"Entity with ID {entity.id} not found")
         
         self._entities[entity.id] = entity
-        logger.info(f"Updated entity with ID {entity.id}")
+        logger.info("Updated entity with ID %s", entity.id)
         return entity
     
     def remove(self, entity_id: uuid.UUID) -> bool:
         """Remove an entity from the repository."""
         if entity_id not in self._entities:
-            logger.warning(f"Entity with ID {entity_id} not found for removal")
+            logger.warning("Entity with ID %s not found for removal", entity_id)
             return False
         
         del self._entities[entity_id]
-        logger.info(f"Removed entity with ID {entity_id}")
+        logger.info("Removed entity with ID %s", entity_id)
         return True
     
     def get_all(self) -> List[T]:
         """Get all entities from the repository."""
         return list(self._entities.values())
 
+class IndexedInMemoryRepository(InMemoryRepository[T]):
+    """In-memory repository that also indexes entities by a parent ID attribute."""
+    
+    _index_attribute: str = ''
+    
+    def __init__(self):
+        super().__init__()
+        self._index: Dict[uuid.UUID, Dict[uuid.UUID, T]] = {}
+        self._index_keys: Dict[uuid.UUID, uuid.UUID] = {}
+    
+    def add(self, entity: T) -> T:
+        """Add an entity to the repository and its index."""
+        super().add(entity)
+        self._reindex(entity)
+        return entity
+    
+    def update(self, entity: T) -> T:
+        """Update an entity in the repository and its index."""
+        super().update(entity)
+        self._reindex(entity)
+        return entity
+    
+    def remove(self, entity_id: uuid.UUID) -> bool:
+        """Remove an entity from the repository and its index."""
+        removed = super().remove(entity_id)
+        if removed:
+            self._unindex(entity_id)
+        return removed
+    
+    def _indexed(self, key: uuid.UUID) -> List[T]:
+        """Get the entities indexed under a parent ID, in insertion order."""
+        return list(self._index.get(key, {}).values())
+    
+    def _reindex(self, entity: T) -> None:
+        key = getattr(entity, self._index_attribute)
+        if self._index_keys.get(entity.id, key) != key:
+            self._unindex(entity.id)
+        self._index.setdefault(key, {})[entity.id] = entity
+        self._index_keys[entity.id] = key
+    
+    def _unindex(self, entity_id: uuid.UUID) -> None:
+        key = self._index_keys.pop(entity_id, None)
+        bucket = self._index.get(key)
+        if bucket is not None:
+            bucket.pop(entity_id, None)
+            if not bucket:
+                del self._index[key]
+
 class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
     """In-memory implementation of UserRepository."""
     
@@ -94,12 +143,12 @@ class InMemoryUserRepository(InMemoryRepository[User], UserRepository):
     def get_sales_managers(self) -> List[User]:
         """Get all sales managers."""
         return [user for user in self._entities.values() 
-                if user.role == UserRole.SALES_MANAGER and user.is_active]
+                if user.role is UserRole.SALES_MANAGER and user.is_active]
     
     def get_solution_architects(self) -> List[User]:
         """Get all solution architects."""
         return [user for user in self._entities.values() 
-                if user.role == UserRole.SOLUTION_ARCHITECT and user.is_active]
+                if user.role is UserRole.SOLUTION_ARCHITECT and user.is_active]
 
 class InMemoryCustomerRepository(InMemoryRepository[Customer], CustomerRepository):
     """In-memory implementation of CustomerRepository."""
@@ -112,6 +161,11 @@ class InMemoryCustomerRepository(InMemoryRepository[Customer], CustomerRepositor
     def get_active_customers(self) -> List[Customer]:
         """Get all active customers."""
         return [customer for customer in self._entities.values() if customer.is_active]
+    
+    def get_by_ids(self, customer_ids: List[uuid.UUID]) -> Dict[uuid.UUID, Customer]:
+        """Get the customers with the given IDs in one lookup, keyed by ID."""
+        return {customer_id: self._entities[customer_id] for customer_id in customer_ids
+                if customer_id in self._entities}
 
 class InMemorySkillsCatalogRepository(InMemoryRepository[SkillsCatalog], SkillsCatalogRepository):
     """In-memory implementation of SkillsCatalogRepository."""
@@ -185,13 +239,14 @@ class InMemoryProblemStatementRepository(InMemoryRepository[ProblemStatement], P
         return [statement for statement in self._entities.values() 
                 if query in statement.content.lower()]
 
-class InMemorySkillRequirementRepository(InMemoryRepository[SkillRequirement], SkillRequirementRepository):
+class InMemorySkillRequirementRepository(IndexedInMemoryRepository[SkillRequirement], SkillRequirementRepository):
     """In-memory implementation of SkillRequirementRepository."""
     
+    _index_attribute = 'opportunity_id'
+    
     def get_by_opportunity(self, opportunity_id: uuid.UUID) -> List[SkillRequirement]:
         """Get skill requirements by opportunity."""
-        return [requirement for requirement in self._entities.values() 
-                if requirement.opportunity_id == opportunity_id]
+        return self._indexed(opportunity_id)
     
     def get_by_skill(self, skill_id: uuid.UUID) -> List[SkillRequirement]:
         """Get skill requirements by skill."""
@@ -200,9 +255,8 @@ class InMemorySkillRequirementRepository(InMemoryRepository[SkillRequirement], S
     
     def get_must_have_skills(self, opportunity_id: uuid.UUID) -> List[SkillRequirement]:
         """Get 'Must Have' skill requirements for an opportunity."""
-        return [requirement for requirement in self._entities.values() 
-                if requirement.opportunity_id == opportunity_id and 
-                requirement.importance_level.value == "Must Have"]
+        return [requirement for requirement in self._indexed(opportunity_id)
+                if requirement.importance_level.value == "Must Have"]
 
 class InMemoryTimelineRequirementRepository(InMemoryRepository[TimelineRequirement], TimelineRequirementRepository):
     """In-memory implementation of TimelineRequirementRepository."""
@@ -216,15 +270,13 @@ class InMemoryTimelineRequirementRepository(InMemoryRepository[TimelineRequireme
     
     def get_by_date_range(self, start_date: str, end_date: str) -> List[TimelineRequirement]:
         """Get timeline requirements within a date range."""
-        from dateutil.parser import parse
-        
-        start = parse(start_date).date()
-        end = parse(end_date).date()
+        start = parse_iso_date(start_date)
+        end = parse_iso_date(end_date)
         
         result = []
         for timeline in self._entities.values():
-            timeline_start = parse(timeline.expected_start_date).date()
-            timeline_end = parse(timeline.expected_end_date).date()
+            timeline_start = parse_iso_date(timeline.expected_start_date)
+            timeline_end = parse_iso_date(timeline.expected_end_date)
             
             # Check if there's any overlap between the date ranges
             if (timeline_start <= end and timeline_end >= start):
@@ -247,21 +299,22 @@ class InMemoryOpportunityStatusRepository(InMemoryRepository[OpportunityStatus],
             return None
         
         # Return the most recent status
-        return max(statuses, key=lambda s: s.changed_at)
+        return max(statuses, key=attrgetter('changed_at'))
     
     def get_status_history(self, opportunity_id: uuid.UUID) -> List[OpportunityStatus]:
         """Get the complete status history for an opportunity."""
         statuses = self.get_by_opportunity(opportunity_id)
         # Sort by changed_at timestamp
-        return sorted(statuses, key=lambda s: s.changed_at)
+        return sorted(statuses, key=attrgetter('changed_at'))
 
-class InMemoryAttachmentRepository(InMemoryRepository[Attachment], AttachmentRepository):
+class InMemoryAttachmentRepository(IndexedInMemoryRepository[Attachment], AttachmentRepository):
     """In-memory implementation of AttachmentRepository."""
     
+    _index_attribute = 'problem_statement_id'
+    
     def get_by_problem_statement(self, problem_statement_id: uuid.UUID) -> List[Attachment]:
         """Get attachments by problem statement."""
-        return [attachment for attachment in self._entities.values() 
-                if attachment.problem_statement_id == problem_statement_id]
+        return self._indexed(problem_statement_id)
     
     def get_by_file_type(self, file_type: str) -> List[Attachment]:
         """Get attachments by file type."""
@@ -270,8 +323,8 @@ class InMemoryAttachmentRepository(InMemoryRepository[Attachment], AttachmentRep
     
     def get_active_attachments(self, problem_statement_id: uuid.UUID) -> List[Attachment]:
         """Get active (not removed) attachments for a problem statement."""
-        return [attachment for attachment in self._entities.values() 
-                if attachment.problem_statement_id == problem_statement_id and not attachment.is_removed]
+        return [attachment for attachment in self._indexed(problem_statement_id)
+                if not attachment.is_removed]
 
 class InMemoryChangeRecordRepository(InMemoryRepository[ChangeRecord], ChangeRecordRepository):
     """In-memory implementation of ChangeRecordRepository."""
@@ -12,7 +12,13 @@ from .enums import Priority, OpportunityStatus
 from .value_objects import GeographicRequirements
 from .common import ValidationException, OperationNotAllowedException, EventPublisher
 
-@dataclass
+# How long a cancelled opportunity can still be reactivated
+REACTIVATION_WINDOW = timedelta(days=90)
+
+# Statuses in which an opportunity can no longer be modified
+_NON_MODIFIABLE_STATUSES = frozenset({OpportunityStatus.ARCHITECT_SELECTED, OpportunityStatus.COMPLETED})
+
+@dataclass(slots=True, eq=False)
 class Opportunity(BaseEntity):
     """Opportunity entity representing a customer opportunity that requires a Solution Architect."""
     
@@ -77,7 +83,7 @@ class Opportunity(BaseEntity):
                           change_record_creator) -> None:
         """Update an opportunity field."""
         # Validate current status
-        if self.status in [OpportunityStatus.ARCHITECT_SELECTED, OpportunityStatus.COMPLETED]:
+        if self.status in _NON_MODIFIABLE_STATUSES:
             raise OperationNotAllowedException(
                 "Opportunities with Architect Selected or Completed status cannot be modified"
             )
@@ -118,10 +124,11 @@ class Opportunity(BaseEntity):
         previous_status = self.status
         
         # Update status and cancellation information
+        now = datetime.now()
         self.status = OpportunityStatus.CANCELLED
-        self.cancelled_at = datetime.now()
+        self.cancelled_at = now
         self.cancellation_reason = reason
-        self.reactivation_deadline = datetime.now() + timedelta(days=90)
+        self.reactivation_deadline = now + REACTIVATION_WINDOW
         self.update()
         
         # Create status record
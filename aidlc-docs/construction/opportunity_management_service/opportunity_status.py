@@ -3,14 +3,33 @@ OpportunityStatus entity for the Opportunity Management Service.
 """
 
 import uuid
+from types import MappingProxyType
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List
+from typing import Optional, Mapping, FrozenSet, List
 from datetime import datetime
 
 from .base_entity import BaseEntity
 from .enums import OpportunityStatus as StatusEnum
 
-@dataclass
+# Define valid transitions
+_VALID_TRANSITIONS: Mapping[StatusEnum, FrozenSet[StatusEnum]] = MappingProxyType({
+    StatusEnum.DRAFT: frozenset({StatusEnum.SUBMITTED, StatusEnum.CANCELLED}),
+    StatusEnum.SUBMITTED: frozenset({StatusEnum.MATCHING_IN_PROGRESS, StatusEnum.CANCELLED}),
+    StatusEnum.MATCHING_IN_PROGRESS: frozenset({StatusEnum.MATCHES_FOUND, StatusEnum.CANCELLED}),
+    StatusEnum.MATCHES_FOUND: frozenset({StatusEnum.ARCHITECT_SELECTED, StatusEnum.CANCELLED}),
+    StatusEnum.ARCHITECT_SELECTED: frozenset({StatusEnum.COMPLETED, StatusEnum.CANCELLED}),
+    StatusEnum.COMPLETED: frozenset(),  # No transitions from Completed
+    StatusEnum.CANCELLED: frozenset()   # No transitions from Cancelled (reactivation is handled separately)
+})
+
+# One bit per status; each mask has the bits of the statuses reachable from that status
+_STATUS_BITS = MappingProxyType({status: 1 << position for position, status in enumerate(StatusEnum)})
+_TRANSITION_MASKS = MappingProxyType({
+    current: sum(_STATUS_BITS[target] for target in targets)
+    for current, targets in _VALID_TRANSITIONS.items()
+})
+
+@dataclass(slots=True, eq=False)
 class OpportunityStatus(BaseEntity):
     """OpportunityStatus entity representing the current status and status history of an opportunity."""
     
@@ -34,15 +53,4 @@ class OpportunityStatus(BaseEntity):
     @staticmethod
     def is_valid_transition(current_status: StatusEnum, new_status: StatusEnum) -> bool:
         """Validate if the transition from current to new status is allowed."""
-        # Define valid transitions
-        valid_transitions = {
-            StatusEnum.DRAFT: [StatusEnum.SUBMITTED, StatusEnum.CANCELLED],
-            StatusEnum.SUBMITTED: [StatusEnum.MATCHING_IN_PROGRESS, StatusEnum.CANCELLED],
-            StatusEnum.MATCHING_IN_PROGRESS: [StatusEnum.MATCHES_FOUND, StatusEnum.CANCELLED],
-            StatusEnum.MATCHES_FOUND: [StatusEnum.ARCHITECT_SELECTED, StatusEnum.CANCELLED],
-            StatusEnum.ARCHITECT_SELECTED: [StatusEnum.COMPLETED, StatusEnum.CANCELLED],
-            StatusEnum.COMPLETED: [],  # No transitions from Completed
-            StatusEnum.CANCELLED: []   # No transitions from Cancelled (reactivation is handled separately)
-        }
-        
-        return new_status in valid_transitions.get(current_status, [])
+        return bool(_TRANSITION_MASKS.get(current_status, 0) & _STATUS_BITS.get(new_status, 0))
@@ -10,7 +10,7 @@ from datetime import datetime
 from .base_entity import BaseEntity
 from .common import ValidationException
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class ProblemStatement(BaseEntity):
     """ProblemStatement entity representing a detailed description of the customer's problem."""
     
@@ -20,6 +20,7 @@ class ProblemStatement(BaseEntity):
     
     def __post_init__(self):
         """Validate the problem statement after initialization."""
+        BaseEntity.__post_init__(self)
         self.validate_content()
     
     @staticmethod
@@ -65,6 +65,11 @@ class CustomerRepository(Repository[T_Customer], ABC):
     def get_active_customers(self) -> List[T_Customer]:
         """Get all active customers."""
         pass
+    
+    @abstractmethod
+    def get_by_ids(self, customer_ids: List[uuid.UUID]) -> Dict[uuid.UUID, T_Customer]:
+        """Get the customers with the given IDs in one lookup, keyed by ID."""
+        pass
 
 class SkillsCatalogRepository(Repository[T_SkillsCatalog], ABC):
     """Repository interface for SkillsCatalog entities."""
@@ -4,14 +4,14 @@ Service layer for the Opportunity Management Service.
 
 import uuid
 from typing import List, Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 
 from .common import ValidationException, NotFoundException, OperationNotAllowedException, EventPublisher
 from .user import User
 from .customer import Customer
 from .skills_catalog import SkillsCatalog
-from .opportunity import Opportunity
+from .opportunity import Opportunity, REACTIVATION_WINDOW
 from .problem_statement import ProblemStatement
 from .skill_requirement import SkillRequirement
 from .timeline_requirement import TimelineRequirement
@@ -61,13 +61,38 @@ class OpportunityService:
                          sales_manager_id: uuid.UUID, description: str, priority: Priority,
                          annual_recurring_revenue: float, geographic_requirements: Dict[str, Any]) -> Opportunity:
         """Create a new opportunity."""
+        opportunity = self._build_opportunity(
+            title, customer_id, customer_name, sales_manager_id, description, priority,
+            annual_recurring_revenue, geographic_requirements
+        )
+        return self._save_new_opportunity(opportunity)
+    
+    def create_opportunities(self, opportunities_data: List[Dict[str, Any]]) -> List[Opportunity]:
+        """Create several opportunities, fetching all of their customers in one lookup.
+        
+        Every item is validated before any is saved, so an invalid item leaves nothing behind.
+        """
+        customers = self.customer_repository.get_by_ids(
+            list({data['customer_id'] for data in opportunities_data})
+        )
+        opportunities = [self._build_opportunity(customers=customers, **data) for data in opportunities_data]
+        return [self._save_new_opportunity(opportunity) for opportunity in opportunities]
+    
+    def _build_opportunity(self, title: str, customer_id: uuid.UUID, customer_name: str,
+                         sales_manager_id: uuid.UUID, description: str, priority: Priority,
+                         annual_recurring_revenue: float, geographic_requirements: Dict[str, Any],
+                         customers: Optional[Dict[uuid.UUID, Customer]] = None) -> Opportunity:
+        """Validate the input for a new opportunity and build it without saving it."""
         # Validate user is a sales manager
         user = self.user_repository.get_by_id(sales_manager_id)
         if not user or not user.is_sales_manager():
             raise OperationNotAllowedException("Only Sales Managers can create opportunities")
         
         # Validate customer exists
-        customer = self.customer_repository.get_by_id(customer_id)
+        if customers is None:
+            customer = self.customer_repository.get_by_id(customer_id)
+        else:
+            customer = customers.get(customer_id)
         if not customer:
             raise NotFoundException(f"Customer with ID {customer_id} not found")
         
@@ -84,9 +109,10 @@ class OpportunityService:
             title, description, customer_id, customer_name, sales_manager_id,
             priority, annual_recurring_revenue, geo_req
         )
+        priority = Priority.from_string(priority)
         
         # Create opportunity
-        opportunity = Opportunity.create_opportunity(
+        return Opportunity.create_opportunity(
             title=title,
             customer_id=customer_id,
             customer_name=customer_name,
@@ -96,7 +122,9 @@ class OpportunityService:
             annual_recurring_revenue=annual_recurring_revenue,
             geographic_requirements=geo_req
         )
-        
+    
+    def _save_new_opportunity(self, opportunity: Opportunity) -> Opportunity:
+        """Save a newly built opportunity with its initial Draft status record."""
         # Save opportunity
         saved_opportunity = self.opportunity_repository.add(opportunity)
         
@@ -104,20 +132,22 @@ class OpportunityService:
         status_record = OpportunityStatus.create_status_record(
             opportunity_id=saved_opportunity.id,
             status=StatusEnum.DRAFT,
-            changed_by=sales_manager_id,
+            changed_by=saved_opportunity.sales_manager_id,
             reason="Opportunity created"
         )
         self.opportunity_status_repository.add(status_record)
         
-        logger.info(f"Created opportunity with ID {saved_opportunity.id}")
+        logger.info("Created opportunity with ID %s", saved_opportunity.id,
+                    extra={"event": "opportunity.created", "opportunity_id": saved_opportunity.id,
+                           "user_id": saved_opportunity.sales_manager_id})
         
         # Publish event
         EventPublisher.publish("opportunity.created", {"opportunity_id": str(saved_opportunity.id)})
         
         return saved_opportunity
     
-    def add_problem_statement(self, opportunity_id: uuid.UUID, content: str) -> ProblemStatement:
-        """Add a problem statement to an opportunity."""
+    def _get_draft_opportunity(self, opportunity_id: uuid.UUID, what: str) -> Opportunity:
+        """Get an opportunity that must still be in Draft status for `what` to be added to it."""
         # Validate opportunity exists
         opportunity = self.opportunity_repository.get_by_id(opportunity_id)
         if not opportunity:
@@ -126,8 +156,24 @@ class OpportunityService:
         # Validate opportunity is in Draft status
         if opportunity.status != StatusEnum.DRAFT:
             raise OperationNotAllowedException(
-                "Problem statement can only be added to opportunities in Draft status"
+                f"{what} can only be added to opportunities in Draft status"
             )
+        return opportunity
+    
+    def _get_active_skill(self, skill_id: uuid.UUID) -> SkillsCatalog:
+        """Get a skill that must exist and be active in the Skills Catalog."""
+        skill = self.skills_catalog_repository.get_by_id(skill_id)
+        if not skill:
+            raise NotFoundException(f"Skill with ID {skill_id} not found in Skills Catalog")
+        
+        if not skill.is_active:
+            raise ValidationException(f"Skill with ID {skill_id} is not active")
+        return skill
+    
+    def add_problem_statement(self, opportunity_id: uuid.UUID, content: str) -> ProblemStatement:
+        """Add a problem statement to an opportunity."""
+        # Validate opportunity exists and is in Draft status
+        self._get_draft_opportunity(opportunity_id, "Problem statement")
         
         # Validate content
         ProblemStatementValidator.validate_content(content)
@@ -148,7 +194,9 @@ class OpportunityService:
         # Save problem statement
         saved_statement = self.problem_statement_repository.add(problem_statement)
         
-        logger.info(f"Added problem statement to opportunity {opportunity_id}")
+        if __debug__:
+            logger.info("Added problem statement to opportunity %s", opportunity_id,
+                        extra={"event": "problem_statement.added", "opportunity_id": opportunity_id})
         
         return saved_statement
     
@@ -156,24 +204,11 @@ class OpportunityService:
                             skill_type: SkillType, importance_level: ImportanceLevel,
                             minimum_proficiency_level: ProficiencyLevel) -> SkillRequirement:
         """Add a skill requirement to an opportunity."""
-        # Validate opportunity exists
-        opportunity = self.opportunity_repository.get_by_id(opportunity_id)
-        if not opportunity:
-            raise NotFoundException(f"Opportunity with ID {opportunity_id} not found")
+        # Validate opportunity exists and is in Draft status
+        self._get_draft_opportunity(opportunity_id, "Skill requirements")
         
-        # Validate opportunity is in Draft status
-        if opportunity.status != StatusEnum.DRAFT:
-            raise OperationNotAllowedException(
-                "Skill requirements can only be added to opportunities in Draft status"
-            )
-        
-        # Validate skill exists in catalog
-        skill = self.skills_catalog_repository.get_by_id(skill_id)
-        if not skill:
-            raise NotFoundException(f"Skill with ID {skill_id} not found in Skills Catalog")
-        
-        if not skill.is_active:
-            raise ValidationException(f"Skill with ID {skill_id} is not active")
+        # Validate skill exists in catalog and is active
+        skill = self._get_active_skill(skill_id)
         
         # Create skill requirement
         skill_requirement = SkillRequirement.create_skill_requirement(
@@ -181,31 +216,61 @@ class OpportunityService:
             skill_id=skill_id,
             skill_name=skill.name,
             skill_type=skill_type,
-            importance_level=importance_level,
+            importance_level=ImportanceLevel.from_string(importance_level),
             minimum_proficiency_level=minimum_proficiency_level
         )
         
         # Save skill requirement
         saved_requirement = self.skill_requirement_repository.add(skill_requirement)
         
-        logger.info(f"Added skill requirement for skill {skill.name} to opportunity {opportunity_id}")
+        if __debug__:
+            logger.info("Added skill requirement for skill %s to opportunity %s", skill.name, opportunity_id,
+                        extra={"event": "skill_requirement.added", "opportunity_id": opportunity_id,
+                               "skill_id": skill_id})
         
         return saved_requirement
     
+    def add_skill_requirements(self, opportunity_id: uuid.UUID,
+                             skill_requirements_data: List[Dict[str, Any]]) -> List[SkillRequirement]:
+        """Add several skill requirements to an opportunity, validating it only once."""
+        # Validate opportunity exists and is in Draft status
+        self._get_draft_opportunity(opportunity_id, "Skill requirements")
+        
+        # Validate every skill before adding any, looking each one up only once
+        skills = {}
+        for data in skill_requirements_data:
+            skill_id = data['skill_id']
+            if skill_id not in skills:
+                skills[skill_id] = self._get_active_skill(skill_id)
+        
+        importance_levels = [ImportanceLevel.from_string(data['importance_level'])
+                             for data in skill_requirements_data]
+        
+        saved_requirements = [
+            self.skill_requirement_repository.add(SkillRequirement.create_skill_requirement(
+                opportunity_id=opportunity_id,
+                skill_id=data['skill_id'],
+                skill_name=skills[data['skill_id']].name,
+                skill_type=data['skill_type'],
+                importance_level=importance_level,
+                minimum_proficiency_level=data['minimum_proficiency_level']
+            ))
+            for data, importance_level in zip(skill_requirements_data, importance_levels)
+        ]
+        
+        if __debug__:
+            logger.info("Added %d skill requirements to opportunity %s", len(saved_requirements), opportunity_id,
+                        extra={"event": "skill_requirements.added", "opportunity_id": opportunity_id,
+                               "count": len(saved_requirements)})
+        
+        return saved_requirements
+    
     def add_timeline_requirement(self, opportunity_id: uuid.UUID, start_date: str,
                                end_date: str, is_flexible: bool,
                                specific_days: Optional[List[str]] = None) -> TimelineRequirement:
         """Add a timeline requirement to an opportunity."""
-        # Validate opportunity exists
-        opportunity = self.opportunity_repository.get_by_id(opportunity_id)
-        if not opportunity:
-            raise NotFoundException(f"Opportunity with ID {opportunity_id} not found")
-        
-        # Validate opportunity is in Draft status
-        if opportunity.status != StatusEnum.DRAFT:
-            raise OperationNotAllowedException(
-                "Timeline requirement can only be added to opportunities in Draft status"
-            )
+        # Validate opportunity exists and is in Draft status
+        self._get_draft_opportunity(opportunity_id, "Timeline requirement")
         
         # Validate timeline
         TimelineValidator.validate_timeline(start_date, end_date, specific_days)
@@ -229,7 +294,9 @@ class OpportunityService:
         # Save timeline requirement
         saved_timeline = self.timeline_requirement_repository.add(timeline_requirement)
         
-        logger.info(f"Added timeline requirement to opportunity {opportunity_id}")
+        if __debug__:
+            logger.info("Added timeline requirement to opportunity %s", opportunity_id,
+                        extra={"event": "timeline_requirement.added", "opportunity_id": opportunity_id})
         
         return saved_timeline
     
@@ -297,7 +364,10 @@ class OpportunityService:
         )
         self.change_record_repository.add(change_record)
         
-        logger.info(f"Submitted opportunity {opportunity_id} for matching")
+        if __debug__:
+            logger.info("Submitted opportunity %s for matching", opportunity_id,
+                        extra={"event": "opportunity.submitted", "opportunity_id": opportunity_id,
+                               "user_id": user_id})
         
         # Publish event
         EventPublisher.publish("opportunity.submitted", {"opportunity_id": str(opportunity_id)})
@@ -331,10 +401,11 @@ class OpportunityService:
         previous_status = opportunity.status
         
         # Update opportunity
+        now = datetime.now()
         opportunity.status = StatusEnum.CANCELLED
-        opportunity.cancelled_at = datetime.now()
+        opportunity.cancelled_at = now
         opportunity.cancellation_reason = reason
-        opportunity.reactivation_deadline = datetime.now() + timedelta(days=90)
+        opportunity.reactivation_deadline = now + REACTIVATION_WINDOW
         opportunity.update()
         
         # Save updated opportunity
@@ -360,7 +431,9 @@ class OpportunityService:
         )
         self.change_record_repository.add(change_record)
         
-        logger.info(f"Cancelled opportunity {opportunity_id}")
+        logger.info("Cancelled opportunity %s", opportunity_id,
+                    extra={"event": "opportunity.cancelled", "opportunity_id": opportunity_id,
+                           "user_id": user_id})
         
         # Publish event
         EventPublisher.publish("opportunity.cancelled", {
@@ -435,7 +508,9 @@ class OpportunityService:
         )
         self.change_record_repository.add(change_record)
         
-        logger.info(f"Reactivated opportunity {opportunity_id}")
+        logger.info("Reactivated opportunity %s", opportunity_id,
+                    extra={"event": "opportunity.reactivated", "opportunity_id": opportunity_id,
+                           "user_id": user_id})
         
         # Publish event
         EventPublisher.publish("opportunity.reactivated", {"opportunity_id": str(opportunity_id)})
@@ -478,26 +553,38 @@ class OpportunityService:
                            priority: str = None, sales_manager_id: uuid.UUID = None,
                            customer_id: uuid.UUID = None) -> List[Opportunity]:
         """Search for opportunities with various filters."""
-        # Start with all opportunities
-        opportunities = self.opportunity_repository.get_all()
-        
-        # Apply filters
-        if query:
-            opportunities = [opp for opp in opportunities 
-                            if query.lower() in opp.title.lower() or 
-                            query.lower() in opp.description.lower()]
-        
-        if status:
-            opportunities = [opp for opp in opportunities if opp.status.value == status]
-        
-        if priority:
-            opportunities = [opp for opp in opportunities if opp.priority.value == priority]
+        # Accept status and priority names or values in any case, e.g. "SUBMITTED" or "Submitted"
+        status = StatusEnum.from_string(status) if status else None
+        priority = Priority.from_string(priority) if priority else None
         
+        # Let the repository apply the most selective filter so fewer rows are scanned here
         if sales_manager_id:
-            opportunities = [opp for opp in opportunities if opp.sales_manager_id == sales_manager_id]
-        
-        if customer_id:
-            opportunities = [opp for opp in opportunities if opp.customer_id == customer_id]
+            opportunities = self.opportunity_repository.get_by_sales_manager(sales_manager_id)
+        elif customer_id:
+            opportunities = self.opportunity_repository.get_by_customer(customer_id)
+        elif status:
+            opportunities = self.opportunity_repository.get_by_status(status.value)
+        elif priority:
+            opportunities = self.opportunity_repository.get_by_priority(priority.value)
+        else:
+            opportunities = self.opportunity_repository.get_all()
+        query = query.lower() if query else None
+        
+        # Apply all filters in a single pass instead of building a list per filter
+        def matches(opp: Opportunity) -> bool:
+            if query and query not in opp.title.lower() and query not in opp.description.lower():
+                return False
+            if status and opp.status is not status:
+                return False
+            if priority and opp.priority is not priority:
+                return False
+            if sales_manager_id and opp.sales_manager_id != sales_manager_id:
+                return False
+            if customer_id and opp.customer_id != customer_id:
+                return False
+            return True
+        
+        opportunities = [opp for opp in opportunities if matches(opp)]
         
         return opportunities
 
@@ -535,7 +622,9 @@ class AttachmentService:
         # Save attachment
         saved_attachment = self.attachment_repository.add(attachment)
         
-        logger.info(f"Added attachment {file_name} to problem statement {problem_statement_id}")
+        logger.info("Added attachment %s to problem statement %s", file_name, problem_statement_id,
+                    extra={"event": "attachment.added", "attachment_id": saved_attachment.id,
+                           "problem_statement_id": problem_statement_id, "user_id": uploaded_by})
         
         return saved_attachment
     
@@ -552,7 +641,9 @@ class AttachmentService:
         # Save updated attachment
         updated_attachment = self.attachment_repository.update(attachment)
         
-        logger.info(f"Removed attachment {attachment_id}")
+        logger.info("Removed attachment %s", attachment_id,
+                    extra={"event": "attachment.removed", "attachment_id": attachment_id,
+                           "user_id": user_id})
         
         return updated_attachment
     
@@ -10,7 +10,7 @@ from datetime import datetime
 from .base_entity import BaseEntity
 from .enums import SkillType, ImportanceLevel, ProficiencyLevel
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SkillRequirement(BaseEntity):
     """SkillRequirement entity representing a specific skill required for an opportunity."""
     
@@ -9,7 +9,7 @@ from typing import Optional, List
 from .base_entity import BaseEntity
 from .enums import SkillCategory
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class SkillsCatalog(BaseEntity):
     """Skills Catalog entity representing a standardized skill in the system."""
     
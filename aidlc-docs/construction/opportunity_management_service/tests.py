@@ -2,11 +2,22 @@
 Unit tests for the Opportunity Management Service.
 """
 
+import logging
+import queue
+import threading
 import unittest
 import uuid
 from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+from .common import EventPublisher, ValidationException, NotFoundException, _DroppingQueueListener
+from .customer import Customer
+from .user import User
+from .timeline_requirement import TimelineRequirement
+from .value_objects import Region, Language
+from .enums import Priority, SkillType, ImportanceLevel, ProficiencyLevel, UserRole
+from .example import setup_repositories_and_services, create_sample_data
+
 # Mock the imports to avoid issues with dataclasses
 class MockUser:
     def __init__(self, id=None, name="", email="", role="", employee_id="", department="", job_title="", is_active=True):
@@ -719,5 +730,274 @@ class TestAttachmentService(unittest.TestCase):
         )
         self.assertEqual(len(active_attachments), 0)
 
+class TestEventPublisher(unittest.TestCase):
+    """Tests for background event dispatch."""
+    
+    def setUp(self):
+        self.subscribers = EventPublisher._subscribers
+        EventPublisher._subscribers = {}
+        self.received = []
+        EventPublisher.subscribe("test_event", self.received.append)
+    
+    def tearDown(self):
+        EventPublisher.stop_background_dispatch()
+        EventPublisher._subscribers = self.subscribers
+    
+    def block_worker(self):
+        """Park the worker inside a subscriber until the returned event is set."""
+        started, release = threading.Event(), threading.Event()
+        EventPublisher.subscribe("block", lambda _: (started.set(), release.wait(5)))
+        EventPublisher.publish("block", None)
+        self.assertTrue(started.wait(5))
+        return release
+    
+    def test_publish_enqueues_for_worker(self):
+        EventPublisher.start_background_dispatch()
+        release = self.block_worker()
+        
+        EventPublisher.publish("test_event", 1)
+        EventPublisher.publish("test_event", 2)
+        
+        # Nothing is delivered on the publishing thread
+        self.assertEqual(self.received, [])
+        release.set()
+        EventPublisher.stop_background_dispatch()
+        self.assertEqual(self.received, [1, 2])
+    
+    def test_full_queue_drops_oldest_event(self):
+        EventPublisher.start_background_dispatch(maxsize=1)
+        release = self.block_worker()
+        
+        EventPublisher.publish("test_event", 1)
+        EventPublisher.publish("test_event", 2)
+        
+        release.set()
+        EventPublisher.stop_background_dispatch()
+        self.assertEqual(self.received, [2])
+    
+    def test_concurrent_publish_never_raises_and_stop_returns(self):
+        EventPublisher.start_background_dispatch(maxsize=1)
+        errors = []
+        
+        def publish_many():
+            try:
+                for i in range(200):
+                    EventPublisher.publish("test_event", i)
+            except Exception as e:
+                errors.append(e)
+        
+        publishers = [threading.Thread(target=publish_many) for _ in range(8)]
+        for publisher in publishers:
+            publisher.start()
+        stopper = threading.Thread(target=EventPublisher.stop_background_dispatch)
+        stopper.start()
+        stopper.join(5)
+        for publisher in publishers:
+            publisher.join(5)
+        
+        self.assertFalse(stopper.is_alive())
+        self.assertEqual(errors, [])
+    
+    def test_stop_returns_to_synchronous_dispatch(self):
+        EventPublisher.start_background_dispatch()
+        EventPublisher.stop_background_dispatch()
+        
+        EventPublisher.publish("test_event", 1)
+        self.assertEqual(self.received, [1])
+
+class TestLogQueue(unittest.TestCase):
+    """Tests for the background log listener."""
+    
+    def test_stop_with_full_queue_drops_oldest_record(self):
+        handled, started, release = [], threading.Event(), threading.Event()
+        
+        class SlowHandler(logging.Handler):
+            def emit(self, record):
+                started.set()
+                release.wait(5)
+                handled.append(record.getMessage())
+        
+        log_queue = queue.Queue(maxsize=2)
+        listener = _DroppingQueueListener(log_queue, SlowHandler())
+        listener.start()
+        # Park the listener in the slow handler, then fill the queue behind it
+        log_queue.put(logging.makeLogRecord({"msg": "first"}))
+        self.assertTrue(started.wait(5))
+        log_queue.put(logging.makeLogRecord({"msg": "second"}))
+        log_queue.put(logging.makeLogRecord({"msg": "third"}))
+        
+        # What stop() does first; a plain QueueListener raises queue.Full here
+        listener.enqueue_sentinel()
+        release.set()
+        listener._thread.join(5)
+        
+        self.assertFalse(listener._thread.is_alive())
+        self.assertEqual(handled, ["first", "third"])
+
+class TestOpportunityServiceInMemory(unittest.TestCase):
+    """Tests for OpportunityService against the in-memory repositories."""
+    
+    def setUp(self):
+        context = setup_repositories_and_services()
+        self.repositories = context["repositories"]
+        self.opportunity_service = context["services"]["opportunity"]
+        self.sample_data = create_sample_data(self.repositories)
+        self.opportunity_data = {
+            "title": "Cloud Migration Project",
+            "customer_id": self.sample_data["customer"].id,
+            "customer_name": self.sample_data["customer"].name,
+            "sales_manager_id": self.sample_data["sales_manager"].id,
+            "description": "Migrate on-premises infrastructure to AWS",
+            "priority": Priority.HIGH,
+            "annual_recurring_revenue": 500000.0,
+            "geographic_requirements": {
+                "region_id": str(uuid.uuid4()),
+                "name": "North America",
+                "requires_physical_presence": True,
+                "allows_remote_work": True
+            }
+        }
+    
+    def test_entities_compare_and_hash_by_id(self):
+        customer = self.sample_data["customer"]
+        renamed = Customer(name="Acme Corporation", industry=customer.industry, id=customer.id)
+        skill = self.sample_data["skills"]["aws_migration"]
+        
+        self.assertEqual(customer, renamed)
+        self.assertEqual({customer, renamed, skill}, {customer, skill})
+    
+    def test_create_opportunities(self):
+        opportunities = self.opportunity_service.create_opportunities(
+            [self.opportunity_data, dict(self.opportunity_data, title="Data Lake Project")]
+        )
+        
+        self.assertEqual([o.title for o in opportunities], ["Cloud Migration Project", "Data Lake Project"])
+        self.assertEqual(len(self.repositories["opportunity"].get_all()), 2)
+        self.assertEqual(len(self.repositories["opportunity_status"].get_all()), 2)
+    
+    def test_create_opportunities_saves_nothing_when_an_item_is_invalid(self):
+        with self.assertRaises(ValidationException):
+            self.opportunity_service.create_opportunities(
+                [self.opportunity_data, dict(self.opportunity_data, title="")]
+            )
+        
+        self.assertEqual(self.repositories["opportunity"].get_all(), [])
+        self.assertEqual(self.repositories["opportunity_status"].get_all(), [])
+    
+    def skill_requirement_data(self, skill, importance_level=ImportanceLevel.MUST_HAVE):
+        return {
+            "skill_id": skill.id,
+            "skill_type": SkillType.TECHNICAL,
+            "importance_level": importance_level,
+            "minimum_proficiency_level": ProficiencyLevel.ADVANCED
+        }
+    
+    def test_add_skill_requirements(self):
+        opportunity = self.opportunity_service.create_opportunity(**self.opportunity_data)
+        skills = self.sample_data["skills"]
+        
+        requirements = self.opportunity_service.add_skill_requirements(opportunity.id, [
+            self.skill_requirement_data(skills["aws_migration"]),
+            self.skill_requirement_data(skills["cloud_architecture"], "nice to have")
+        ])
+        
+        self.assertEqual([r.skill_name for r in requirements], ["AWS Migration", "Cloud Architecture"])
+        self.assertIs(requirements[1].importance_level, ImportanceLevel.NICE_TO_HAVE)
+        saved = self.repositories["skill_requirement"].get_by_opportunity(opportunity.id)
+        self.assertEqual(len(saved), 2)
+    
+    def test_add_skill_requirements_saves_nothing_when_a_skill_is_missing(self):
+        opportunity = self.opportunity_service.create_opportunity(**self.opportunity_data)
+        missing_skill = MockSkillsCatalog(name="Unknown")
+        
+        with self.assertRaises(NotFoundException):
+            self.opportunity_service.add_skill_requirements(opportunity.id, [
+                self.skill_requirement_data(self.sample_data["skills"]["aws_migration"]),
+                self.skill_requirement_data(missing_skill)
+            ])
+        
+        self.assertEqual(self.repositories["skill_requirement"].get_by_opportunity(opportunity.id), [])
+    
+    def test_search_opportunities_matches_priority_in_any_case(self):
+        self.opportunity_service.create_opportunity(**self.opportunity_data)
+        self.opportunity_service.create_opportunity(**dict(self.opportunity_data, priority=Priority.LOW))
+        
+        for priority in ("High", "high", "HIGH", Priority.HIGH):
+            results = self.opportunity_service.search_opportunities(priority=priority)
+            self.assertEqual([o.priority for o in results], [Priority.HIGH])
+
+class TestUser(unittest.TestCase):
+    """Tests for User role normalization."""
+    
+    def create_user(self, role):
+        return User(name="Jane Doe", email="jane.doe@example.com", role=role,
+                    employee_id="EMP54321", department="Sales", job_title="Sales Manager")
+    
+    def test_role_accepts_names_and_values_in_any_case(self):
+        for role in (UserRole.SALES_MANAGER, "SalesManager", "salesmanager", "SALES_MANAGER"):
+            self.assertIs(self.create_user(role).role, UserRole.SALES_MANAGER)
+    
+    def test_invalid_role_raises_validation_exception(self):
+        with self.assertRaises(ValidationException):
+            self.create_user("Manager")
+
+class TestValueObjects(unittest.TestCase):
+    """Tests for value object equality."""
+    
+    def test_equality_is_by_type_and_value(self):
+        region_id = uuid.uuid4()
+        region = Region(region_id=region_id, name="EMEA", is_willing_to_travel=True)
+        
+        self.assertEqual(region, Region(region_id=region_id, name="EMEA", is_willing_to_travel=True))
+        self.assertEqual(len({region, Region(region_id=region_id, name="EMEA", is_willing_to_travel=True)}), 1)
+        self.assertNotEqual(region, Language(language_id=region_id, name="EMEA", proficiency_level=True))
+        self.assertNotEqual(region, (region_id, "EMEA", True))
+
+class TestTimelineRequirementBatchValidation(unittest.TestCase):
+    """Tests that the vectorized batch validation agrees with the per-timeline check."""
+    
+    def create_timeline(self, **changes):
+        timeline = TimelineRequirement.create_timeline_requirement(
+            opportunity_id=uuid.uuid4(),
+            start_date="2025-01-01",
+            end_date="2025-03-31",
+            is_flexible=False,
+            specific_days=["2025-02-14"]
+        )
+        # Bypass the check in __post_init__ to build invalid timelines
+        for attribute, value in changes.items():
+            setattr(timeline, attribute, value)
+        return timeline
+    
+    def test_valid_batch(self):
+        timelines = [self.create_timeline(), self.create_timeline(expected_end_date="2025-06-30")]
+        self.assertTrue(TimelineRequirement.validate_batch(timelines))
+        # Formats only the lenient parser understands are accepted as well
+        lenient = self.create_timeline(expected_end_date="2025/03/31")
+        self.assertTrue(lenient.validate_timeline())
+        self.assertTrue(TimelineRequirement.validate_batch(timelines + [lenient]))
+        self.assertTrue(TimelineRequirement.validate_batch([]))
+    
+    def test_invalid_timelines_are_rejected_like_the_scalar_check(self):
+        invalid_changes = [
+            {"expected_end_date": "2024-12-31"},
+            {"expected_end_date": ""},
+            {"expected_end_date": "NaT"},
+            {"expected_start_date": "NaT"},
+            {"specific_required_days": ["2025-05-01"]},
+            {"specific_required_days": ["NaT"]},
+            {"expected_end_date": "today"},
+            {"expected_end_date": "+002026-01-01"},
+            {"expected_start_date": "2025-02-30"},
+            {"specific_required_days": ["today"]},
+        ]
+        for changes in invalid_changes:
+            with self.subTest(**changes):
+                timeline = self.create_timeline(**changes)
+                with self.assertRaises(ValidationException):
+                    timeline.validate_timeline()
+                with self.assertRaises(ValidationException):
+                    TimelineRequirement.validate_batch([self.create_timeline(), timeline])
+
 if __name__ == '__main__':
     unittest.main()
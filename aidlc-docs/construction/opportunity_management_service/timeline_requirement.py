@@ -2,16 +2,19 @@
 TimelineRequirement entity for the Opportunity Management Service.
 """
 
+import re
 import uuid
 from dataclasses import dataclass, field
 from typing import Optional, List
 from datetime import datetime, date
-from dateutil.parser import parse
 
 from .base_entity import BaseEntity
-from .common import ValidationException
+from .common import ValidationException, parse_iso_date
 
-@dataclass
+# Only plain YYYY-MM-DD strings are read the same way by numpy and parse_iso_date
+_STRICT_ISO_DATE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+
+@dataclass(slots=True, eq=False)
 class TimelineRequirement(BaseEntity):
     """TimelineRequirement entity representing the timeline specifications for an opportunity."""
     
@@ -23,6 +26,7 @@ class TimelineRequirement(BaseEntity):
     
     def __post_init__(self):
         """Validate the timeline requirement after initialization."""
+        BaseEntity.__post_init__(self)
         self.validate_timeline()
     
     @staticmethod
@@ -59,8 +63,8 @@ class TimelineRequirement(BaseEntity):
     def validate_timeline(self) -> bool:
         """Validate that the timeline information is complete and logical."""
         try:
-            start_date = parse(self.expected_start_date).date()
-            end_date = parse(self.expected_end_date).date()
+            start_date = parse_iso_date(self.expected_start_date)
+            end_date = parse_iso_date(self.expected_end_date)
             
             # Validate end date is after start date
             if end_date <= start_date:
@@ -69,7 +73,7 @@ class TimelineRequirement(BaseEntity):
             # Validate specific days fall within start and end dates
             if self.specific_required_days:
                 for day_str in self.specific_required_days:
-                    day = parse(day_str).date()
+                    day = parse_iso_date(day_str)
                     if day < start_date or day > end_date:
                         raise ValidationException(
                             f"Specific required day {day_str} is outside the timeline range"
@@ -80,3 +84,44 @@ class TimelineRequirement(BaseEntity):
             raise ValidationException(f"Invalid date format: {str(e)}")
         except Exception as e:
             raise ValidationException(f"Timeline validation error: {str(e)}")
+
+    @classmethod
+    def validate_batch(cls, timelines: List['TimelineRequirement']) -> bool:
+        """Validate many timeline requirements at once using vectorized date comparisons."""
+        import numpy as np
+
+        if not timelines:
+            return True
+
+        dates = [value for t in timelines
+                 for value in (t.expected_start_date, t.expected_end_date, *t.specific_required_days)]
+        if not all(isinstance(value, str) and _STRICT_ISO_DATE.fullmatch(value) for value in dates):
+            # Anything else needs the per-timeline parser, which numpy would read differently
+            for timeline in timelines:
+                timeline.validate_timeline()
+            return True
+
+        try:
+            starts = np.array([t.expected_start_date for t in timelines], dtype='datetime64[D]')
+            ends = np.array([t.expected_end_date for t in timelines], dtype='datetime64[D]')
+            days = np.array([day for t in timelines for day in t.specific_required_days],
+                            dtype='datetime64[D]')
+        except ValueError:
+            # Well-formed but impossible dates such as 2025-02-30 get their detailed error here
+            for timeline in timelines:
+                timeline.validate_timeline()
+            return True
+
+        invalid = ends <= starts
+        if days.size:
+            # Map every specific day back to the timeline it belongs to
+            owners = np.repeat(np.arange(len(timelines)),
+                               [len(t.specific_required_days) for t in timelines])
+            out_of_range = (days < starts[owners]) | (days > ends[owners])
+            invalid[owners[out_of_range]] = True
+
+        # Re-run the scalar check on the offenders to raise the first detailed error
+        for offender in np.flatnonzero(invalid):
+            timelines[offender].validate_timeline()
+
+        return True
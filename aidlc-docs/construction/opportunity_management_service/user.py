@@ -7,13 +7,15 @@ from datetime import datetime
 from dataclasses import dataclass, field
 from typing import Optional
 
-@dataclass
+from .enums import UserRole
+
+@dataclass(slots=True)
 class User:
     """User entity representing basic user information across the system."""
     
     name: str
     email: str
-    role: str  # UserRole enum as string
+    role: UserRole  # UserRole member or its string value
     employee_id: str
     department: str
     job_title: str
@@ -25,6 +27,10 @@ class User:
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
     
+    def __post_init__(self):
+        """Normalize the role to a UserRole member so role checks are identity tests."""
+        self.role = UserRole.from_string(self.role)
+    
     def update(self) -> None:
         """Update the entity's last modified timestamp."""
         self.updated_at = datetime.now()
@@ -48,31 +54,27 @@ class User:
                       department: Optional[str] = None, job_title: Optional[str] = None,
                       profile_picture_url: Optional[str] = None, phone_number: Optional[str] = None) -> None:
         """Update user profile information."""
-        if name:
-            self.name = name
-        if email:
-            self.email = email
-        if department:
-            self.department = department
-        if job_title:
-            self.job_title = job_title
-        if profile_picture_url:
-            self.profile_picture_url = profile_picture_url
-        if phone_number:
-            self.phone_number = phone_number
-        self.update()
+        changed = False
+        for attribute, value in (("name", name), ("email", email), ("department", department),
+                                 ("job_title", job_title), ("profile_picture_url", profile_picture_url),
+                                 ("phone_number", phone_number)):
+            if value:
+                setattr(self, attribute, value)
+                changed = True
+        if changed:
+            self.update()
     
     def is_sales_manager(self) -> bool:
         """Check if the user is a Sales Manager."""
-        return self.role == "SalesManager" and self.is_active
+        return self.role is UserRole.SALES_MANAGER and self.is_active
     
     def is_solution_architect(self) -> bool:
         """Check if the user is a Solution Architect."""
-        return self.role == "SolutionArchitect" and self.is_active
+        return self.role is UserRole.SOLUTION_ARCHITECT and self.is_active
     
     def is_admin(self) -> bool:
         """Check if the user is an Admin."""
-        return self.role == "Admin" and self.is_active
+        return self.role is UserRole.ADMIN and self.is_active
     
     def __eq__(self, other):
         """Entities are equal if their IDs are equal."""
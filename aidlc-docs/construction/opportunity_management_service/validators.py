@@ -6,10 +6,31 @@ import uuid
 from typing import List, Optional, Dict, Any
 import logging
 
-from .common import ValidationException, NotFoundException
+from .common import ValidationException, NotFoundException, parse_iso_date
+from .enums import ImportanceLevel
 
 logger = logging.getLogger(__name__)
 
+# Constant validation error messages
+_ERR_TITLE_REQUIRED = "Title is required"
+_ERR_DESCRIPTION_REQUIRED = "Description is required"
+_ERR_CUSTOMER_NAME_REQUIRED = "Customer name is required"
+_ERR_CUSTOMER_ID_REQUIRED = "Customer ID is required"
+_ERR_SALES_MANAGER_ID_REQUIRED = "Sales Manager ID is required"
+_ERR_PRIORITY_REQUIRED = "Priority is required"
+_ERR_GEOGRAPHIC_REQUIREMENTS_REQUIRED = "Geographic requirements are required"
+_ERR_NEGATIVE_ARR = "Annual Recurring Revenue must be a non-negative value"
+_ERR_PROBLEM_STATEMENT_REQUIRED = "Problem statement content is required"
+_ERR_SKILL_REQUIREMENTS_REQUIRED = "At least one skill requirement is required"
+_ERR_MUST_HAVE_SKILL_REQUIRED = "At least one 'Must Have' skill is required"
+_ERR_END_BEFORE_START = "End date must be after start date"
+_ERR_FILE_NAME_REQUIRED = "File name is required"
+_ERR_FILE_TYPE_REQUIRED = "File type is required"
+_ERR_FILE_TOO_LARGE = "File size exceeds the maximum allowed size of 20MB"
+
+# Maximum attachment size (20MB limit as per clarification)
+_MAX_ATTACHMENT_BYTES = 20 * 1024 * 1024
+
 class OpportunityValidator:
     """Validator for Opportunity entities."""
     
@@ -19,31 +40,22 @@ class OpportunityValidator:
                                priority: Any, annual_recurring_revenue: float,
                                geographic_requirements: Any) -> None:
         """Validate required fields for opportunity creation."""
-        if not title:
-            raise ValidationException("Title is required")
-        
-        if not description:
-            raise ValidationException("Description is required")
-        
-        if not customer_id:
-            raise ValidationException("Customer ID is required")
-        
-        if not customer_name:
-            raise ValidationException("Customer name is required")
-        
-        if not sales_manager_id:
-            raise ValidationException("Sales Manager ID is required")
-        
-        if not priority:
-            raise ValidationException("Priority is required")
-        
-        if annual_recurring_revenue is None or annual_recurring_revenue < 0:
-            raise ValidationException("Annual Recurring Revenue must be a non-negative value")
-        
-        if not geographic_requirements:
-            raise ValidationException("Geographic requirements are required")
-        
-        logger.info("Opportunity required fields validated successfully")
+        # Cheap string checks first, then identifiers and objects
+        for value, message in ((title, _ERR_TITLE_REQUIRED),
+                               (description, _ERR_DESCRIPTION_REQUIRED),
+                               (customer_name, _ERR_CUSTOMER_NAME_REQUIRED),
+                               (customer_id, _ERR_CUSTOMER_ID_REQUIRED),
+                               (sales_manager_id, _ERR_SALES_MANAGER_ID_REQUIRED),
+                               (priority, _ERR_PRIORITY_REQUIRED),
+                               (geographic_requirements, _ERR_GEOGRAPHIC_REQUIREMENTS_REQUIRED)):
+            if not value:
+                raise ValidationException(message)
+
+        arr = annual_recurring_revenue
+        if arr is None or arr < 0:
+            raise ValidationException(_ERR_NEGATIVE_ARR)
+
+        logger.debug("Opportunity required fields validated successfully")
 
 class ProblemStatementValidator:
     """Validator for ProblemStatement entities."""
@@ -52,14 +64,14 @@ class ProblemStatementValidator:
     def validate_content(content: str, minimum_character_count: int = 140) -> None:
         """Validate problem statement content."""
         if not content:
-            raise ValidationException("Problem statement content is required")
+            raise ValidationException(_ERR_PROBLEM_STATEMENT_REQUIRED)
         
         if len(content) < minimum_character_count:
             raise ValidationException(
                 f"Problem statement must be at least {minimum_character_count} characters long"
             )
         
-        logger.info("Problem statement content validated successfully")
+        logger.debug("Problem statement content validated successfully")
 
 class SkillRequirementValidator:
     """Validator for SkillRequirement entities."""
@@ -68,14 +80,14 @@ class SkillRequirementValidator:
     def validate_skill_requirements(skill_requirements: List[Any]) -> None:
         """Validate skill requirements."""
         if not skill_requirements:
-            raise ValidationException("At least one skill requirement is required")
+            raise ValidationException(_ERR_SKILL_REQUIREMENTS_REQUIRED)
         
         # Check if at least one "Must Have" skill is specified
-        must_have_skills = [sr for sr in skill_requirements if sr.importance_level.value == "Must Have"]
-        if not must_have_skills:
-            raise ValidationException("At least one 'Must Have' skill is required")
+        has_must_have = any(sr.importance_level is ImportanceLevel.MUST_HAVE for sr in skill_requirements)
+        if not has_must_have:
+            raise ValidationException(_ERR_MUST_HAVE_SKILL_REQUIRED)
         
-        logger.info("Skill requirements validated successfully")
+        logger.debug("Skill requirements validated successfully")
     
     @staticmethod
     def validate_skill_exists(skill_id: uuid.UUID, skills_catalog_repository) -> None:
@@ -87,7 +99,7 @@ class SkillRequirementValidator:
         if not skill.is_active:
             raise ValidationException(f"Skill with ID {skill_id} is not active")
         
-        logger.info(f"Skill {skill_id} validated successfully")
+        logger.debug("Skill %s validated successfully", skill_id)
 
 class TimelineValidator:
     """Validator for TimelineRequirement entities."""
@@ -95,25 +107,22 @@ class TimelineValidator:
     @staticmethod
     def validate_timeline(start_date: str, end_date: str, specific_days: Optional[List[str]] = None) -> None:
         """Validate timeline information."""
-        from datetime import datetime
-        from dateutil.parser import parse
-        
         try:
-            start = parse(start_date).date()
-            end = parse(end_date).date()
+            start = parse_iso_date(start_date)
+            end = parse_iso_date(end_date)
             
             if end <= start:
-                raise ValidationException("End date must be after start date")
+                raise ValidationException(_ERR_END_BEFORE_START)
             
             if specific_days:
                 for day_str in specific_days:
-                    day = parse(day_str).date()
+                    day = parse_iso_date(day_str)
                     if day < start or day > end:
                         raise ValidationException(
                             f"Specific required day {day_str} is outside the timeline range"
                         )
             
-            logger.info("Timeline validated successfully")
+            logger.debug("Timeline validated successfully")
             
         except ValueError as e:
             raise ValidationException(f"Invalid date format: {str(e)}")
@@ -125,17 +134,13 @@ class AttachmentValidator:
     def validate_attachment(file_name: str, file_type: str, file_size: int) -> None:
         """Validate attachment information."""
         if not file_name:
-            raise ValidationException("File name is required")
-        
+            raise ValidationException(_ERR_FILE_NAME_REQUIRED)
         if not file_type:
-            raise ValidationException("File type is required")
-        
-        # Validate file size (20MB limit as per clarification)
-        max_size = 20 * 1024 * 1024  # 20MB in bytes
-        if file_size > max_size:
-            raise ValidationException(f"File size exceeds the maximum allowed size of 20MB")
+            raise ValidationException(_ERR_FILE_TYPE_REQUIRED)
+        if file_size > _MAX_ATTACHMENT_BYTES:
+            raise ValidationException(_ERR_FILE_TOO_LARGE)
         
-        logger.info("Attachment validated successfully")
+        logger.debug("Attachment validated successfully")
 
 class StatusTransitionValidator:
     """Validator for status transitions."""
@@ -150,4 +155,5 @@ class StatusTransitionValidator:
                 f"Invalid status transition from {current_status.value} to {new_status.value}"
             )
         
-        logger.info(f"Status transition from {current_status.value} to {new_status.value} validated successfully")
+        logger.debug("Status transition from %s to %s validated successfully",
+                     current_status.value, new_status.value)
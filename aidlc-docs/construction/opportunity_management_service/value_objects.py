@@ -4,9 +4,9 @@ Value objects for the Opportunity Management Service.
 
 import uuid
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Optional, Tuple
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GeographicRequirements:
     """Geographic location requirements for an opportunity."""
     
@@ -15,7 +15,7 @@ class GeographicRequirements:
     requires_physical_presence: bool
     allows_remote_work: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DateRange:
     """Date range for availability or timeline."""
     
@@ -24,7 +24,7 @@ class DateRange:
     is_recurring: bool = False
     recurring_pattern: Optional[str] = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Region:
     """Geographic region."""
     
@@ -32,7 +32,7 @@ class Region:
     name: str
     is_willing_to_travel: bool
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Language:
     """Language with proficiency level."""
     
@@ -40,16 +40,16 @@ class Language:
     name: str
     proficiency_level: str  # From LanguageProficiencyLevel enum
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Industry:
     """Industry knowledge with experience."""
     
     industry_id: uuid.UUID
     name: str
     years_of_experience: int
-    specific_domains: List[str] = None
+    specific_domains: Tuple[str, ...] = ()
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Skill:
     """Skill with proficiency level."""
     
@@ -59,7 +59,7 @@ class Skill:
     years_of_experience: int
     is_custom: bool = False
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Certification:
     """Professional certification."""
     
@@ -9,23 +9,6 @@ import os
 # Add the parent directory to the path so we can import the package
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Import test cases
-from opportunity_management_service.tests import TestOpportunityService, TestAttachmentService
-
 if __name__ == '__main__':
-    # Create a test loader
-    loader = unittest.TestLoader()
-    
-    # Create a test suite
-    test_suite = unittest.TestSuite()
-    
-    # Add test cases
-    test_suite.addTests(loader.loadTestsFromTestCase(TestOpportunityService))
-    test_suite.addTests(loader.loadTestsFromTestCase(TestAttachmentService))
-    
-    # Run the tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(test_suite)
-    
-    # Exit with non-zero code if tests failed
-    sys.exit(not result.wasSuccessful())
+    # Discover and run every TestCase in the test module; exits non-zero on failure
+    unittest.main(module='opportunity_management_service.tests', verbosity=2)